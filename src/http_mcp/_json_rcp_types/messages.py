@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Literal
+from typing import Any, Final, Literal
 
-from pydantic import BaseModel, ValidationInfo, field_validator
+from pydantic import BaseModel, TypeAdapter, ValidationInfo, field_validator
 
 from http_mcp._json_rcp_types.errors import Error  # noqa: TC001
 
@@ -51,3 +51,8 @@ class JSONRPCNotification(BaseModel):
 
 class JSONRPCError(JSONRPCMessage):
     error: Error
+
+
+# Compiled once at import; every transport validates incoming requests
+# through this single adapter instead of touching the model class per call.
+JSONRPC_REQUEST_ADAPTER: Final[TypeAdapter[JSONRPCRequest]] = TypeAdapter(JSONRPCRequest)
@@ -1,14 +1,15 @@
 import asyncio
-import json
 import logging
 import sys
 from typing import TYPE_CHECKING
 
+import orjson
 from pydantic import ValidationError
 from starlette.requests import Request
 
 from http_mcp._json_rcp_types.errors import Error, ErrorCode
 from http_mcp._json_rcp_types.messages import (
+    JSONRPC_REQUEST_ADAPTER,
     JSONRPCError,
     JSONRPCMessage,
     JSONRPCRequest,
@@ -76,9 +77,12 @@ class StdioTransport(BaseTransport):
             LOGGER.debug("Received message: %s", line[:_MAX_LOG_LENGTH])
             json_message = {}
             try:
-                json_message = json.loads(line)
+                json_message = orjson.loads(line)
+                if isinstance(json_message, list):
+                    await self._handle_batch_message(json_message, writer, request_headers)
+                    continue
                 await self._handle_message(
-                    JSONRPCRequest.model_validate(json_message),
+                    JSONRPC_REQUEST_ADAPTER.validate_python(json_message),
                     writer,
                     request_headers,
                 )
@@ -95,7 +99,7 @@ class StdioTransport(BaseTransport):
                     writer,
                     error_response.model_dump_json(by_alias=True, exclude_none=True),
                 )
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 error_response = JSONRPCError(
                     jsonrpc="2.0",
                     error=Error(
@@ -120,12 +124,8 @@ class StdioTransport(BaseTransport):
         writer.write(b"\n")
         await writer.drain()
 
-    async def _handle_message(
-        self,
-        message: JSONRPCRequest,
-        writer: asyncio.StreamWriter,
-        request_headers: dict[str, str] | None = None,
-    ) -> None:
+    @staticmethod
+    def _build_request(request_headers: dict[str, str] | None = None) -> Request:
         asgi_headers: list[tuple[bytes, bytes]] = (
             [(k.lower().encode(), v.encode()) for k, v in request_headers.items()]
             if request_headers
@@ -140,7 +140,42 @@ class StdioTransport(BaseTransport):
             "server": ("127.0.0.1", 0),
             "root_path": "",
         }
-        dummy_request = Request(scope)
+        return Request(scope)
+
+    async def _handle_batch_message(
+        self,
+        raw_messages: list,
+        writer: asyncio.StreamWriter,
+        request_headers: dict[str, str] | None = None,
+    ) -> None:
+        if not raw_messages:
+            error_response = JSONRPCError(
+                jsonrpc="2.0",
+                error=Error(
+                    code=ErrorCode.INVALID_PARAMS,
+                    description="Invalid Request: empty batch",
+                ),
+            )
+            await self._write_response(
+                writer,
+                error_response.model_dump_json(by_alias=True, exclude_none=True),
+            )
+            return
+
+        responses = await self._process_batch(raw_messages, self._build_request(request_headers))
+        if responses:
+            await self._write_response(
+                writer,
+                self.encode_batch_responses(responses).decode("utf-8"),
+            )
+
+    async def _handle_message(
+        self,
+        message: JSONRPCRequest,
+        writer: asyncio.StreamWriter,
+        request_headers: dict[str, str] | None = None,
+    ) -> None:
+        dummy_request = self._build_request(request_headers)
 
         async def process(msg: JSONRPCRequest) -> JSONRPCMessage | JSONRPCError | None:
             if msg.method.startswith("notifications/"):
@@ -1,11 +1,14 @@
+import asyncio
 import logging
 from http import HTTPStatus
 
+import orjson
 from pydantic import ValidationError
 from starlette.requests import Request
 
 from http_mcp._json_rcp_types.errors import Error, ErrorCode
 from http_mcp._json_rcp_types.messages import (
+    JSONRPC_REQUEST_ADAPTER,
     JSONRPCError,
     JSONRPCMessage,
     JSONRPCRequest,
@@ -32,6 +35,7 @@ from http_mcp._mcp_types.tools import (
     ToolsListResult,
 )
 from http_mcp.exceptions import (
+    InsufficientScopeError,
     PromptInvocationError,
     ProtocolError,
     ServerError,
@@ -65,6 +69,82 @@ class BaseTransport:
 
         return await self._process_prompts_request(message, request)
 
+    async def _process_batch(
+        self,
+        raw_messages: list,
+        request: Request,
+    ) -> tuple[JSONRPCMessage, ...]:
+        """Process a JSON-RPC batch, preserving request order in the responses.
+
+        Items run concurrently; notifications are omitted from the result per
+        the JSON-RPC 2.0 specification.
+        """
+        responses = await asyncio.gather(
+            *(self._process_batch_item(raw_message, request) for raw_message in raw_messages),
+        )
+        return tuple(response for response in responses if response is not None)
+
+    async def _process_batch_item(
+        self,
+        raw_message: object,
+        request: Request,
+    ) -> JSONRPCMessage | None:
+        if isinstance(raw_message, dict) and str(raw_message.get("method", "")).startswith(
+            "notifications/",
+        ):
+            return None
+
+        message_id = raw_message.get("id") if isinstance(raw_message, dict) else None
+        if not isinstance(message_id, int | str):
+            message_id = None
+
+        try:
+            message = JSONRPC_REQUEST_ADAPTER.validate_python(raw_message)
+        except ValidationError:
+            LOGGER.exception("Batch item validation error")
+            return JSONRPCError(
+                jsonrpc="2.0",
+                id=message_id,
+                error=Error(
+                    code=ErrorCode.INVALID_PARAMS,
+                    description="Error validating message request",
+                ),
+            )
+
+        try:
+            return await self._process_request(message, request)
+        except InsufficientScopeError as e:
+            required = " ".join(e.required_scopes) if e.required_scopes else "unknown"
+            return JSONRPCError(
+                jsonrpc="2.0",
+                id=message.id,
+                error=Error(
+                    code=ErrorCode.RESOURCE_NOT_FOUND,
+                    description=f"Insufficient scope; required: {required}",
+                ),
+            )
+        except Exception:
+            LOGGER.exception("Unexpected error processing batch item")
+            return JSONRPCError(
+                jsonrpc="2.0",
+                id=message.id,
+                error=Error(
+                    code=ErrorCode.INTERNAL_ERROR,
+                    description="Internal server error",
+                ),
+            )
+
+    @staticmethod
+    def encode_batch_responses(responses: tuple[JSONRPCMessage, ...]) -> bytes:
+        return (
+            b"["
+            + b",".join(
+                response.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
+                for response in responses
+            )
+            + b"]"
+        )
+
     def _handle_initialization(
         self,
         message: JSONRPCRequest,
@@ -238,6 +318,10 @@ class BaseTransport:
                 request,
             )
 
+            # The tool output is already validated by its declared model;
+            # serialize it once and reuse the JSON for both content fields.
+            payload = returned_value.model_dump_json(by_alias=True)
+
             return ToolsCallResponse(
                 jsonrpc="2.0",
                 id=message.id,
@@ -245,11 +329,11 @@ class BaseTransport:
                     content=(
                         TextContent(
                             type="text",
-                            text=returned_value.model_dump_json(by_alias=True),
+                            text=payload,
                         ),
                     ),
                     is_error=False,
-                    structured_content=returned_value.model_dump(mode="json", by_alias=True),
+                    structured_content=orjson.loads(payload),
                 ),
             )
         except (ProtocolError, ToolNotFoundError) as e:
@@ -1,13 +1,14 @@
-import json
 import logging
 from http import HTTPStatus
 
+import orjson
 from pydantic import ValidationError
 from starlette.requests import Request
 from starlette.types import Receive, Scope, Send
 
 from http_mcp._json_rcp_types.errors import Error, ErrorCode
 from http_mcp._json_rcp_types.messages import (
+    JSONRPC_REQUEST_ADAPTER,
     JSONRPCError,
     JSONRPCRequest,
 )
@@ -22,6 +23,12 @@ _SECURITY_HEADERS: list[tuple[bytes, bytes]] = [
     (b"x-content-type-options", b"nosniff"),
     (b"cache-control", b"no-store"),
 ]
+# Every JSON response carries the same headers; build the list once instead of
+# re-assembling it per response.
+_JSON_RESPONSE_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"content-type", b"application/json"),
+    *_SECURITY_HEADERS,
+]
 
 
 class HTTPTransport(BaseTransport):
@@ -65,8 +72,8 @@ class HTTPTransport(BaseTransport):
             return
 
         try:
-            raw_message = json.loads(body)
-        except json.JSONDecodeError:
+            raw_message = orjson.loads(body)
+        except orjson.JSONDecodeError:
             await self._send_error_response(
                 send,
                 ErrorResponseInfo(
@@ -77,8 +84,47 @@ class HTTPTransport(BaseTransport):
             )
             return
 
+        if isinstance(raw_message, list):
+            await self._handle_batch(raw_message, send, request)
+            return
+
         await self._handle_raw_message(raw_message, send, request)
 
+    async def _handle_batch(
+        self,
+        raw_messages: list,
+        send: Send,
+        request: Request,
+    ) -> None:
+        if not raw_messages:
+            await self._send_error_response(
+                send,
+                ErrorResponseInfo(
+                    protocol_code=ErrorCode.INVALID_PARAMS,
+                    http_status_code=HTTPStatus.BAD_REQUEST,
+                    message="Invalid Request: empty batch",
+                ),
+            )
+            return
+
+        responses = await self._process_batch(raw_messages, request)
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": HTTPStatus.OK.value,
+                "headers": _JSON_RESPONSE_HEADERS,
+            },
+        )
+        await send(
+            {
+                "type": "http.response.body",
+                # Per spec, a batch of notifications only yields no response array.
+                "body": self.encode_batch_responses(responses) if responses else b"",
+                "more_body": False,
+            },
+        )
+
     async def _handle_raw_message(
         self,
         raw_message: dict,
@@ -91,10 +137,7 @@ class HTTPTransport(BaseTransport):
                     {
                         "type": "http.response.start",
                         "status": 200,
-                        "headers": [
-                            (b"content-type", b"application/json"),
-                            *_SECURITY_HEADERS,
-                        ],
+                        "headers": _JSON_RESPONSE_HEADERS,
                     },
                 )
 
@@ -107,7 +150,7 @@ class HTTPTransport(BaseTransport):
                 )
                 return None
 
-            request_message = JSONRPCRequest.model_validate(raw_message)
+            request_message = JSONRPC_REQUEST_ADAPTER.validate_python(raw_message)
         except ValidationError:
             LOGGER.exception("Error validating message")
             is_invalid_method = raw_message.get("method", "") not in self.supported_methods
@@ -156,10 +199,7 @@ class HTTPTransport(BaseTransport):
             {
                 "type": "http.response.start",
                 "status": HTTPStatus.OK.value,
-                "headers": [
-                    (b"content-type", b"application/json"),
-                    *_SECURITY_HEADERS,
-                ],
+                "headers": _JSON_RESPONSE_HEADERS,
             },
         )
 
@@ -176,10 +216,7 @@ class HTTPTransport(BaseTransport):
             {
                 "type": "http.response.start",
                 "status": HTTPStatus.FORBIDDEN.value,
-                "headers": [
-                    (b"content-type", b"application/json"),
-                    *_SECURITY_HEADERS,
-                ],
+                "headers": _JSON_RESPONSE_HEADERS,
             },
         )
         await send(
@@ -224,7 +261,7 @@ class HTTPTransport(BaseTransport):
             ),
         )
 
-        response_headers = [(b"content-type", b"application/json"), *_SECURITY_HEADERS]
+        response_headers = list(_JSON_RESPONSE_HEADERS)
         if error_info.headers:
             response_headers.extend(
                 [(k.lower().encode(), v.encode()) for k, v in error_info.headers.items()],
@@ -25,6 +25,20 @@ class MCPServer(ServerInterface):
         self._name = name
         self._tools = tools
         self._prompts = prompts
+        self._tools_by_name = {_tool.name: _tool for _tool in tools}
+        self._prompts_by_name = {_prompt.name: _prompt for _prompt in prompts}
+        # The tools/list payload is a static function of the registered tools;
+        # build the schema dicts once, pre-sorted by name, and only apply the
+        # per-request scope filter at call time.
+        self._tool_schemas = tuple(
+            (_tool, _tool.generate_json_schema())
+            for _tool in sorted(tools, key=lambda _tool: _tool.name)
+        )
+        # Same idea for prompts/list: the protocol objects never change after
+        # registration, so build them once here.
+        self._prompt_protocol_objects = tuple(
+            (_prompt, _prompt.to_prompt_protocol_object()) for _prompt in prompts
+        )
         self._instructions = instructions
         self._http_transport = HTTPTransport(self)
         self._stdio_transport = StdioTransport(self)
@@ -57,9 +71,9 @@ class MCPServer(ServerInterface):
 
     def list_tools(self, request: Request) -> tuple[dict, ...]:
         return tuple(
-            _tool.generate_json_schema()
-            for _tool in self._tools
-            if has_required_scope(request, _tool.scopes)
+            schema
+            for _tool, schema in self._tool_schemas
+            if not _tool.scopes or has_required_scope(request, _tool.scopes)
         )
 
     async def call_tool(
@@ -68,11 +82,10 @@ class MCPServer(ServerInterface):
         args: dict,
         request: Request,
     ) -> BaseModel:
-        try:
-            tool = next(_tool for _tool in self._tools if _tool.name == tool_name)
-        except StopIteration as e:
-            raise ToolNotFoundError(tool_name) from e
-        if not has_required_scope(request, tool.scopes):
+        tool = self._tools_by_name.get(tool_name)
+        if tool is None:
+            raise ToolNotFoundError(tool_name)
+        if tool.scopes and not has_required_scope(request, tool.scopes):
             raise InsufficientScopeError(tool.scopes)
 
         return await tool.invoke(args, request)
@@ -80,9 +93,9 @@ class MCPServer(ServerInterface):
     def list_prompts(self, request: Request) -> PromptListResult:
         return PromptListResult(
             prompts=tuple(
-                _prompt.to_prompt_protocol_object()
-                for _prompt in self._prompts
-                if has_required_scope(request, _prompt.scopes)
+                protocol_prompt
+                for _prompt, protocol_prompt in self._prompt_protocol_objects
+                if not _prompt.scopes or has_required_scope(request, _prompt.scopes)
             ),
             next_cursor=None,
         )
@@ -93,11 +106,10 @@ class MCPServer(ServerInterface):
         arguments: dict,
         request: Request,
     ) -> PromptGetResult:
-        try:
-            _prompt = next(_prompt for _prompt in self._prompts if _prompt.name == prompt_name)
-        except StopIteration as e:
-            raise PromptNotFoundError(prompt_name) from e
-        if not has_required_scope(request, _prompt.scopes):
+        _prompt = self._prompts_by_name.get(prompt_name)
+        if _prompt is None:
+            raise PromptNotFoundError(prompt_name)
+        if _prompt.scopes and not has_required_scope(request, _prompt.scopes):
             raise InsufficientScopeError(_prompt.scopes)
 
         result = await _prompt.invoke(arguments, request)
@@ -1,5 +1,6 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import cast
 
 from pydantic import BaseModel, Field
 from starlette.requests import Request
@@ -14,16 +15,24 @@ class NoArguments(BaseModel):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Arguments[TInputs: BaseModel | None]:
     request: Request
     inputs: TInputs
+    _state_cache: dict[tuple[str, type], object] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
 
     def get_state_key[TKey](
         self,
         key: str,
         _object_type: type[TKey],
     ) -> TKey:
+        cached = self._state_cache.get((key, _object_type))
+        if cached is not None:
+            return cast("TKey", cached)
         if not hasattr(self.request.state, key):
             message = (
                 f"Key {key} not found in request state, make sure to add it to the"
@@ -42,6 +51,7 @@ class Arguments[TInputs: BaseModel | None]:
             message = f"State key '{key}' type mismatch: expected type does not match stored type"
             raise ServerError(Error(code=ErrorCode.INTERNAL_ERROR, description=message))
 
+        self._state_cache[(key, _object_type)] = value
         return value
 
 
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import inspect
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
@@ -28,7 +29,7 @@ class Prompt[TArguments: BaseModel | None]:
     arguments_type: type[TArguments]
     scopes: tuple[str, ...] = ()
 
-    @property
+    @functools.cached_property
     def arguments(self) -> tuple[PromptArgument, ...]:
         if issubclass(self.arguments_type, type(None)):
             return ()
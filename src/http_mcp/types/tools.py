@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import inspect
 from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
@@ -12,7 +13,7 @@ from http_mcp.types.models import Arguments, ErrorMessage
 from http_mcp.types.utils import generate_union_schema, sanitize_validation_errors
 
 
-@dataclass
+@dataclass(frozen=True)
 class Tool[TInputs: BaseModel | None, TOutput: BaseModel]:
     """Represents a tool that can be invoked with validated arguments.
 
@@ -52,7 +53,7 @@ class Tool[TInputs: BaseModel | None, TOutput: BaseModel]:
     return_error_message: bool = False
     scopes: tuple[str, ...] = ()
 
-    @property
+    @functools.cached_property
     def annotations(self) -> Mapping[str, str | bool]:
         return {
             "title": self.title,
@@ -74,7 +75,7 @@ class Tool[TInputs: BaseModel | None, TOutput: BaseModel]:
     def description(self) -> str:
         return self.func.__doc__ or "No description"
 
-    @property
+    @functools.cached_property
     def input_schema(self) -> dict:
         if issubclass(self.inputs, type(None)):
 
@@ -87,7 +88,7 @@ class Tool[TInputs: BaseModel | None, TOutput: BaseModel]:
         schema["title"] = self.name + "Arguments"
         return schema
 
-    @property
+    @functools.cached_property
     def output_schema(self) -> dict:
         if self.return_error_message:
             schema = generate_union_schema(self.output, ErrorMessage)
@@ -0,0 +1,15 @@
+import orjson
+
+
+def assert_json_equal(actual: object, expected: object) -> None:
+    """Assert two JSON-serializable structures are equal.
+
+    Comparing orjson-canonicalized bytes lets the Rust encoder walk both
+    structures instead of a Python-level dict comparison; on mismatch, fall
+    back to the structural comparison so pytest renders a readable diff.
+    """
+    if orjson.dumps(actual, option=orjson.OPT_SORT_KEYS) != orjson.dumps(
+        expected,
+        option=orjson.OPT_SORT_KEYS,
+    ):
+        assert actual == expected
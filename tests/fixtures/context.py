@@ -1,21 +1,37 @@
-from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import Sequence
+
+# Bound the call history so long-lived servers cannot grow it without limit.
+_MAX_CALLED_TOOLS = 10_000
 
 
-@dataclass
 class Context:
-    called_tools: list[str] = field(default_factory=list)
-    cache: dict[str, str] = field(default_factory=dict)
-    request_count: int = 0
-    notes: dict[str, list[str]] = field(default_factory=dict)
+    __slots__ = ("_called_tools", "cache", "notes", "request_count")
+
+    def __init__(
+        self,
+        called_tools: Sequence[str] = (),
+        cache: dict[str, str] | None = None,
+        request_count: int = 0,
+        notes: dict[str, list[str]] | None = None,
+    ) -> None:
+        self._called_tools: deque[str] = deque(called_tools, maxlen=_MAX_CALLED_TOOLS)
+        self.cache = cache if cache is not None else {}
+        self.request_count = request_count
+        self.notes = notes if notes is not None else {}
+
+    @property
+    def called_tools(self) -> list[str]:
+        return list(self._called_tools)
 
     def get_called_tools(self) -> list[str]:
-        return self.called_tools
+        return list(self._called_tools)
 
     def add_called_tool(self, tool_name: str) -> None:
-        self.called_tools.append(tool_name)
+        self._called_tools.append(tool_name)
 
     def clear(self) -> None:
-        self.called_tools = []
+        self._called_tools.clear()
 
     def increment_request_count(self) -> int:
         self.request_count += 1
@@ -34,12 +34,17 @@ class BasicAuthBackend(AuthenticationBackend):
 
     def __init__(self, granted_scopes: Sequence[str] = ("authenticated",)) -> None:
         self.granted_scopes = granted_scopes
+        # Credentials and users are immutable for the backend's lifetime;
+        # build them once instead of allocating per authenticated request.
+        self._credentials = AuthCredentials(granted_scopes)
+        self._user = SimpleUser("unittesting@mcp.com")
+        self._anonymous = (AuthCredentials(), UnauthenticatedUser())
         super().__init__()
 
     async def authenticate(self, conn: HTTPConnection) -> tuple[AuthCredentials, BaseUser]:
         if conn.headers.get("Authorization") == "Bearer TEST_TOKEN":
-            return AuthCredentials(self.granted_scopes), SimpleUser("unittesting@mcp.com")
-        return AuthCredentials(), UnauthenticatedUser()
+            return self._credentials, self._user
+        return self._anonymous
 
 
 class State(TypedDict):
@@ -67,6 +72,9 @@ def mount_mcp_server(
         else None,
     )
     app.mount("/mcp", server.app)
+    # Build the composed ASGI chain once at mount time instead of lazily on
+    # the first request.
+    app.middleware_stack = app.build_middleware_stack()
     return app
 
 
@@ -107,6 +115,7 @@ app.mount(
     "/mcp",
     mcp_server.app,
 )
+app.middleware_stack = app.build_middleware_stack()
 
 
 class MultiState(TypedDict):
@@ -138,6 +147,7 @@ def mount_mcp_server_multi_state(
         else None,
     )
     app.mount("/mcp", server.app)
+    app.middleware_stack = app.build_middleware_stack()
     return app
 
 
@@ -0,0 +1,174 @@
+from http import HTTPStatus
+
+from starlette.testclient import TestClient
+
+from http_mcp._json_rcp_types.errors import ErrorCode
+from http_mcp._mcp_types.content import TextContent
+from http_mcp._mcp_types.prompts import PromptMessage
+from http_mcp.server import MCPServer
+from http_mcp.types import Arguments, Prompt, Tool
+from tests.fixtures.models import TestToolArguments, TestToolOutput
+
+# ---------------------------------------------------------------------------
+# Helper tools and prompts for batch requests
+# ---------------------------------------------------------------------------
+
+
+async def batch_tool(args: Arguments[TestToolArguments]) -> TestToolOutput:
+    """Answer a question."""
+    return TestToolOutput(answer=f"Hello, {args.inputs.question}!")
+
+
+def batch_prompt() -> tuple[PromptMessage, ...]:
+    """Test prompt for batch requests."""
+    return (PromptMessage(role="user", content=TextContent(text="Batch prompt.")),)
+
+
+SERVER = MCPServer(
+    name="test",
+    version="1.0.0",
+    tools=(
+        Tool(
+            func=batch_tool,
+            inputs=TestToolArguments,
+            output=TestToolOutput,
+        ),
+    ),
+    prompts=(
+        Prompt(
+            func=batch_prompt,
+            arguments_type=type(None),
+        ),
+    ),
+)
+
+
+def test_batch_request() -> None:
+    client = TestClient(SERVER.app)
+    response = client.post(
+        "/mcp",
+        json=[
+            {
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "id": 1,
+                "params": {
+                    "name": "batch_tool",
+                    "arguments": {"question": "What is the meaning of life?"},
+                },
+            },
+            {
+                "jsonrpc": "2.0",
+                "method": "prompts/get",
+                "id": 2,
+                "params": {"name": "batch_prompt", "arguments": {}},
+            },
+        ],
+    )
+    assert response.status_code == HTTPStatus.OK
+    response_json = response.json()
+    assert response_json == [
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": '{"answer":"Hello, What is the meaning of life?!"}',
+                    },
+                ],
+                "structuredContent": {"answer": "Hello, What is the meaning of life?!"},
+                "isError": False,
+            },
+        },
+        {
+            "jsonrpc": "2.0",
+            "id": 2,
+            "result": {
+                "description": "Test prompt for batch requests.",
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": {"text": "Batch prompt.", "type": "text"},
+                    },
+                ],
+            },
+        },
+    ]
+
+
+def test_batch_request_omits_notifications() -> None:
+    client = TestClient(SERVER.app)
+    response = client.post(
+        "/mcp",
+        json=[
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "id": 1,
+                "params": {
+                    "name": "batch_tool",
+                    "arguments": {"question": "What is the meaning of life?"},
+                },
+            },
+        ],
+    )
+    assert response.status_code == HTTPStatus.OK
+    response_json = response.json()
+    assert len(response_json) == 1
+    assert response_json[0]["id"] == 1
+
+
+def test_batch_request_only_notifications() -> None:
+    client = TestClient(SERVER.app)
+    response = client.post(
+        "/mcp",
+        json=[
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "method": "notifications/unsubscribe"},
+        ],
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.content == b""
+
+
+def test_batch_request_with_invalid_item() -> None:
+    client = TestClient(SERVER.app)
+    invalid_item = {"jsonrpc": "2.0", "id": 1}
+    valid_item = {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "id": 2,
+        "params": {
+            "name": "batch_tool",
+            "arguments": {"question": "What is the meaning of life?"},
+        },
+    }
+    response = client.post("/mcp", json=[invalid_item, valid_item])
+    assert response.status_code == HTTPStatus.OK
+    response_json = response.json()
+    assert response_json[0] == {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "error": {
+            "code": ErrorCode.INVALID_PARAMS.value,
+            "message": "Error validating message request",
+        },
+    }
+    assert response_json[1]["id"] == valid_item["id"]
+    assert response_json[1]["result"]["isError"] is False
+
+
+def test_empty_batch_request() -> None:
+    client = TestClient(SERVER.app)
+    response = client.post("/mcp", json=[])
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {
+        "jsonrpc": "2.0",
+        "error": {
+            "code": ErrorCode.INVALID_PARAMS.value,
+            "message": "Invalid Request: empty batch",
+        },
+    }
@@ -375,32 +375,38 @@ def test_prompt_not_found() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_call_prompt_with_scope() -> None:
-    def prompt_with_scope() -> tuple[PromptMessage, ...]:
-        """Private prompt.
-
-        Only accessible to authenticated users with the 'private' scope.
-        """
-        return (
-            PromptMessage(
-                role="user",
-                content=TextContent(text="This is a private prompt."),
-            ),
-        )
-
-    server = MCPServer(
-        tools=(),
-        name="test",
-        version="1.0.0",
-        prompts=(
-            Prompt(
-                func=prompt_with_scope,
-                arguments_type=type(None),
-                scopes=("private",),
-            ),
+def prompt_with_scope() -> tuple[PromptMessage, ...]:
+    """Private prompt.
+
+    Only accessible to authenticated users with the 'private' scope.
+    """
+    return (
+        PromptMessage(
+            role="user",
+            content=TextContent(text="This is a private prompt."),
         ),
     )
-    app = mount_mcp_server(server, BasicAuthBackend(("private",)))
+
+
+# Built once at module scope: Prompt construction runs Pydantic schema
+# generation and MCPServer builds its dispatch state, so the scope tests
+# only assemble the app/backend pair that actually varies.
+SCOPED_PROMPT_SERVER = MCPServer(
+    tools=(),
+    name="test",
+    version="1.0.0",
+    prompts=(
+        Prompt(
+            func=prompt_with_scope,
+            arguments_type=type(None),
+            scopes=("private",),
+        ),
+    ),
+)
+
+
+def test_call_prompt_with_scope() -> None:
+    app = mount_mcp_server(SCOPED_PROMPT_SERVER, BasicAuthBackend(("private",)))
     with TestClient(app, headers={"Authorization": "Bearer TEST_TOKEN"}) as client:
         response = client.post(
             "/mcp",
@@ -439,31 +445,7 @@ def test_call_prompt_with_scope() -> None:
 
 
 def test_call_prompt_without_required_scope() -> None:
-    def prompt_with_scope() -> tuple[PromptMessage, ...]:
-        """Private prompt.
-
-        Only accessible to authenticated users with the 'private' scope.
-        """
-        return (
-            PromptMessage(
-                role="user",
-                content=TextContent(text="This is a private prompt."),
-            ),
-        )
-
-    server = MCPServer(
-        tools=(),
-        name="test",
-        version="1.0.0",
-        prompts=(
-            Prompt(
-                func=prompt_with_scope,
-                arguments_type=type(None),
-                scopes=("private",),
-            ),
-        ),
-    )
-    app = mount_mcp_server(server, BasicAuthBackend(("non_sufficient_scope",)))
+    app = mount_mcp_server(SCOPED_PROMPT_SERVER, BasicAuthBackend(("non_sufficient_scope",)))
     with TestClient(app, headers={"Authorization": "Bearer TEST_TOKEN"}) as client:
         response = client.post(
             "/mcp",
@@ -1,5 +1,6 @@
 from http import HTTPStatus
 
+import pytest
 from starlette.testclient import TestClient
 
 from http_mcp.server import MCPServer
@@ -143,53 +144,23 @@ def test_protocol_initialization() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_server_call_tool() -> None:
-    server = MCPServer(
-        tools=TOOLS_SIMPLE_SERVER_WITH_CONTEXT,
-        name="test",
-        version="1.0.0",
-    )
-    app = mount_mcp_server(server)
-    with TestClient(app, headers={"Authorization": "Bearer TEST_TOKEN"}) as client:
-        response = client.post(
-            "/mcp",
-            json={
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "id": 1,
-                "params": {
-                    "name": "simple_server_tool_with_context",
-                    "arguments": {"question": "What is the meaning of life?"},
-                },
-            },
-        )
-        assert response.status_code == HTTPStatus.OK
-        response_json = response.json()
-        assert response_json == {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "result": {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": '{"answer":"Hello, What is the meaning of life?!"}',
-                    },
-                ],
-                "structuredContent": {"answer": "Hello, What is the meaning of life?!"},
-                "isError": False,
-            },
-        }
-
-        assert client.app_state["context"].called_tools == ["simple_server_tool_with_context"]
-
-
-def test_server_call_tool_with_scope() -> None:
+@pytest.mark.parametrize(
+    ("tools", "backend"),
+    [
+        (TOOLS_SIMPLE_SERVER_WITH_CONTEXT, None),
+        (TOOLS_SIMPLE_SERVER_WITH_SCOPES, BasicAuthBackend(("private",))),
+    ],
+)
+def test_server_call_tool(
+    tools: tuple[Tool, ...],
+    backend: BasicAuthBackend | None,
+) -> None:
     server = MCPServer(
-        tools=TOOLS_SIMPLE_SERVER_WITH_SCOPES,
+        tools=tools,
         name="test",
         version="1.0.0",
     )
-    app = mount_mcp_server(server, BasicAuthBackend(("private",)))
+    app = mount_mcp_server(server, backend)
     with TestClient(app, headers={"Authorization": "Bearer TEST_TOKEN"}) as client:
         response = client.post(
             "/mcp",
